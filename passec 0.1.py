@@ -1,7 +1,301 @@
 import re
 import math
+import bisect
 import hashlib
-from typing import Optional, Tuple
+import functools
+import mmap
+import os
+import sys
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+try:
+    import requests
+    _HAVE_REQUESTS = True
+except ImportError:  # deep analysis skips the online breach check
+    _HAVE_REQUESTS = False
+
+# ANSI terminal colors
+_C_RED = '\033[91m'
+_C_YELLOW = '\033[93m'
+_C_GREEN = '\033[92m'
+_C_CYAN = '\033[96m'
+_C_BLUE = '\033[94m'
+_C_BOLD = '\033[1m'
+_C_RESET = '\033[0m'
+
+# Result 'color' names to escape codes
+_COLOR_MAP = {
+    'red': _C_RED,
+    'orange': _C_YELLOW,
+    'yellow': _C_YELLOW,
+    'blue': _C_BLUE,
+    'green': _C_GREEN,
+    'cyan': _C_CYAN,
+}
+
+# Feedback severities to escape codes
+_SEVERITY_COLORS = {
+    'ok': _C_GREEN,
+    'bad': _C_RED,
+    'warn': _C_YELLOW,
+    'crit': _C_RED,
+}
+
+# Patterns are compiled once at import instead of on every check
+_RE_REPEAT = re.compile(r'(.)\1{2,}')
+
+# Case-insensitive so callers don't need a lowercased copy of the password;
+# re.ASCII keeps the folding to what str.lower() did (no 'ſ' matching 's')
+_RE_KEYBOARD = re.compile(r'qwer|asdf', re.IGNORECASE | re.ASCII)
+_COMMON_WORDS = ('password', 'admin', 'welcome', 'login', '123456')
+_RE_COMMON = re.compile('|'.join(map(re.escape, _COMMON_WORDS)), re.IGNORECASE | re.ASCII)
+
+# Crack time units by length in seconds; each unit applies from one of
+# itself up to one of the next
+_CRACK_UNITS = (
+    (1, 'seconds'),
+    (60, 'minutes'),
+    (3600, 'hours'),
+    (86400, 'days'),
+    (2592000, 'months'),
+    (31536000, 'years'),
+)
+_CRACK_THRESHOLDS = tuple(divisor for divisor, _ in _CRACK_UNITS)
+
+# Character class bits, OR-ed together per byte by _scan()
+_LOWER = 1
+_UPPER = 2
+_DIGIT = 4
+_SPECIAL = 8
+_HIGH = 16  # non-ASCII byte
+
+# Bitmaps of the bytes that may start a flagged ascending run ("123", "abc")
+_RUNS_QUICK = sum(1 << c for c in b'1234567abc')
+_RUNS_DEEP = sum(1 << c for c in b'01234567abc')
+
+
+def _classify(byte: int) -> int:
+    """Class bit for a single UTF-8 byte (non-ASCII bytes count as special)"""
+    if 97 <= byte <= 122:
+        return _LOWER
+    if 65 <= byte <= 90:
+        return _UPPER
+    if 48 <= byte <= 57:
+        return _DIGIT
+    if byte >= 128:
+        return _SPECIAL | _HIGH
+    return _SPECIAL
+
+
+_CLASS_LUT = bytes(_classify(i) for i in range(256))
+
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_ALNUM_SET = _ASCII_LOWER | _ASCII_UPPER | _DIGITS
+
+
+def _char_classes(password: str) -> int:
+    """Class bitmask from the distinct characters only (no pattern checks)"""
+    chars = set(password)
+    mask = 0
+    if not _ASCII_LOWER.isdisjoint(chars): mask |= _LOWER
+    if not _ASCII_UPPER.isdisjoint(chars): mask |= _UPPER
+    if not _DIGITS.isdisjoint(chars): mask |= _DIGIT
+    if not chars <= _ALNUM_SET: mask |= _SPECIAL
+    return mask
+
+
+def _charset_size(mask: int) -> int:
+    """Size of the alphabet spanned by the classes in mask"""
+    charset = 0
+    if mask & _LOWER: charset += 26
+    if mask & _UPPER: charset += 26
+    if mask & _DIGIT: charset += 10
+    if mask & _SPECIAL: charset += 32
+    return charset
+
+
+def _scan_bytes(data: bytes) -> Tuple[int, bool, int, int]:
+    """Class mask, repeat flag, run-start bitmap and seen-byte bitmap of data"""
+    mask = 0
+    repeat = False
+    runs = 0
+    seen = 0
+    # 0xFF never occurs in UTF-8, so it can't extend a repeat or a run
+    p1 = p2 = f1 = f2 = 0xFF
+    for c in data:
+        k = _CLASS_LUT[c]
+        mask |= k
+        f = c | (k & _UPPER) << 4  # ASCII lowercase: set 0x20 on uppercase
+        if c == p1 == p2 and c < 128 and c != 10:  # '.' skips newlines
+            repeat = True
+        if f - f1 == 1 and f1 - f2 == 1:
+            runs |= 1 << f2
+        seen |= 1 << c
+        p2, p1, f2, f1 = p1, c, f1, f
+    return mask, repeat, runs, seen
+
+
+def _unrolled_scan_source(n: int) -> str:
+    """Source of a _scan_bytes() equivalent with the loop unrolled for n bytes"""
+    names = [f"c{i}" for i in range(n)]
+    lines = [f"def _scan_{n}(data):", f"    {', '.join(names)} = data", "    repeat = False", "    runs = 0"]
+    for i in range(n):
+        lines.append(f"    k{i} = _CLASS_LUT[c{i}]")
+        lines.append(f"    f{i} = c{i} | (k{i} & _UPPER) << 4")
+        if i >= 1:
+            lines.append(f"    up{i} = f{i} - f{i - 1} == 1")
+        if i >= 2:
+            lines.append(f"    if c{i} == c{i - 1} == c{i - 2} and c{i} < 128 and c{i} != 10:")
+            lines.append("        repeat = True")
+            lines.append(f"    if up{i} and up{i - 1}:")
+            lines.append(f"        runs |= 1 << f{i - 2}")
+    lines.append(f"    mask = {' | '.join(f'k{i}' for i in range(n))}")
+    lines.append(f"    seen = {' | '.join(f'1 << c{i}' for i in range(n))}")
+    lines.append("    return mask, repeat, runs, seen")
+    return "\n".join(lines) + "\n"
+
+
+def _build_unrolled_scans(lengths) -> dict:
+    """Compile unrolled scanners for the most common password lengths"""
+    scans = {}
+    for n in lengths:
+        namespace = {}
+        exec(_unrolled_scan_source(n), globals(), namespace)
+        scans[n] = namespace[f"_scan_{n}"]
+    return scans
+
+
+# Straight-line versions skip the loop overhead for typical 8-20 byte passwords
+_UNROLLED_SCANS = _build_unrolled_scans(range(8, 21))
+
+
+def _scan(password: str) -> Tuple[int, bool, int, int]:
+    """Single pass over the password's UTF-8 bytes.
+
+    Returns the character class bitmask, whether a character appears three
+    times in a row, a bitmap of the lowercased bytes that start an
+    ascending run of three (e.g. bit ord('a') for "abc" or "ABC"), and a
+    bitmap of the bytes seen (only meaningful without the _HIGH class).
+    """
+    data = password.encode('utf-8', 'surrogatepass')
+    mask, repeat, runs, seen = _UNROLLED_SCANS.get(len(data), _scan_bytes)(data)
+    
+    # Multi-byte characters can't be compared bytewise, let the regex decide
+    if not repeat and mask & _HIGH:
+        repeat = _RE_REPEAT.search(password) is not None
+    return mask, repeat, runs, seen
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_tables():
+    """NumPy and its copies of the scan tables, or None without NumPy
+    
+    Imported on first use so quick and deep checks don't pay for it.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # batch_check falls back to a plain loop
+        return None
+    class_lut = np.frombuffer(_CLASS_LUT, np.uint8)
+    runs_quick = np.array([bool(_RUNS_QUICK >> i & 1) for i in range(256)])
+    return np, class_lut, runs_quick
+
+
+def _scan_batch(passwords: List[str]):
+    """Vectorized _scan() over many passwords (requires NumPy).
+    
+    All passwords are concatenated into one byte buffer so each check is a
+    single array operation. Returns per-password arrays of class masks,
+    repeat flags and quick-mode sequential-run flags.
+    """
+    np, class_lut, runs_quick = _numpy_tables()
+    n = len(passwords)
+    encoded = [p.encode('utf-8', 'surrogatepass') for p in passwords]
+    lengths = np.fromiter(map(len, encoded), np.int64, n)
+    buf = np.frombuffer(b''.join(encoded), np.uint8)
+    starts = np.zeros(n, np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    
+    masks = np.zeros(n, np.uint8)
+    repeats = np.zeros(n, bool)
+    runs = np.zeros(n, bool)
+    
+    classes = class_lut[buf]
+    nonempty = lengths > 0
+    if buf.size:
+        masks[nonempty] = np.bitwise_or.reduceat(classes, starts[nonempty])
+    
+    # Windows of three bytes, kept only if they don't straddle two passwords
+    owner = np.repeat(np.arange(n), lengths)
+    same = owner[2:] == owner[:-2]
+    c0, c1, c2 = buf[:-2], buf[1:-1], buf[2:]
+    repeat_at = same & (c0 == c1) & (c1 == c2) & (c2 < 128) & (c2 != 10)
+    
+    folded = (buf | (classes & _UPPER) << 4).astype(np.int16)
+    step = np.diff(folded) == 1
+    run_at = same & step[:-1] & step[1:] & runs_quick[folded[:-2]]
+    
+    repeats[owner[:-2][repeat_at]] = True
+    runs[owner[:-2][run_at]] = True
+    
+    # Same regex fallback as _scan() for multi-byte characters
+    for i in np.flatnonzero((masks & _HIGH).astype(bool) & ~repeats):
+        repeats[i] = _RE_REPEAT.search(passwords[i]) is not None
+    return masks, repeats, runs
+
+
+# Runs breach lookups in the background while local scoring proceeds
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+_SESSION = None
+
+
+def _session():
+    """Shared HTTP session so repeat checks reuse the TLS connection"""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.headers['Add-Padding'] = 'true'
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_range(prefix: str) -> bytes:
+    """Fetch the breached hash suffixes for a 5 character SHA-1 prefix
+    
+    Responses are cached in memory per prefix, so re-checking a password
+    (or one sharing its prefix) in the same session skips the network.
+    Padding makes every response roughly the same size on the wire.
+    """
+    url = f"https://api.pwnedpasswords.com/range/{prefix}"
+    response = _session().get(url, timeout=3)
+    response.raise_for_status()
+    return response.content
+
+
+def _find_hash_line(data, key: bytes) -> Optional[bytes]:
+    """Binary search sorted "HASH:COUNT" lines for the one starting with key"""
+    lo, hi = 0, len(data)  # both always sit on a line start (or EOF)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = data.rfind(b'\n', lo, mid) + 1 or lo
+        end = data.find(b'\n', start)
+        if end < 0:
+            end = len(data)
+        
+        line_hash = data[start:start + len(key)]
+        if line_hash == key:
+            return data[start:end]
+        if line_hash < key:
+            lo = end + 1
+        else:
+            hi = start
+    return None
+
 
 class SimplePasswordChecker:
     """Fast, offline password checking - no dependencies needed"""
@@ -9,47 +303,64 @@ class SimplePasswordChecker:
     @staticmethod
     def quick_check(password: str) -> dict:
         """Quick password strength check - instant results"""
+        mask, repeat, runs, _ = _scan(password)
+        return SimplePasswordChecker._score(len(password), mask, repeat, bool(runs & _RUNS_QUICK))
+    
+    @staticmethod
+    def batch_check(passwords: List[str]) -> List[dict]:
+        """Quick check many passwords at once, vectorized when NumPy is available"""
+        if _numpy_tables() is None:
+            return [SimplePasswordChecker.quick_check(p) for p in passwords]
+        
+        masks, repeats, runs = _scan_batch(passwords)
+        return [
+            SimplePasswordChecker._score(len(p), m, r, s)
+            for p, m, r, s in zip(passwords, masks.tolist(), repeats.tolist(), runs.tolist())
+        ]
+    
+    @staticmethod
+    def _score(length: int, mask: int, repeat: bool, sequential: bool) -> dict:
+        """Build the quick check result from the scanned password features"""
         score = 0
         feedback = []
         
         # Length check
-        length = len(password)
         if length >= 12:
             score += 2
-            feedback.append("✓ Good length")
+            feedback.append(('ok', "✓ Good length"))
         elif length >= 8:
             score += 1
-            feedback.append("✓ Acceptable length")
+            feedback.append(('ok', "✓ Acceptable length"))
         else:
-            feedback.append("✗ Too short")
+            feedback.append(('bad', "✗ Too short"))
         
         # Character types
-        if re.search(r'[A-Z]', password) and re.search(r'[a-z]', password):
+        if mask & _UPPER and mask & _LOWER:
             score += 1
-            feedback.append("✓ Mixed case letters")
+            feedback.append(('ok', "✓ Mixed case letters"))
         else:
-            feedback.append("✗ Missing uppercase or lowercase")
+            feedback.append(('bad', "✗ Missing uppercase or lowercase"))
         
-        if re.search(r'[0-9]', password):
+        if mask & _DIGIT:
             score += 1
-            feedback.append("✓ Contains numbers")
+            feedback.append(('ok', "✓ Contains numbers"))
         else:
-            feedback.append("✗ No numbers")
+            feedback.append(('bad', "✗ No numbers"))
         
-        if re.search(r'[^a-zA-Z0-9]', password):
+        if mask & _SPECIAL:
             score += 1
-            feedback.append("✓ Contains special characters")
+            feedback.append(('ok', "✓ Contains special characters"))
         else:
-            feedback.append("✗ No special characters")
+            feedback.append(('bad', "✗ No special characters"))
         
         # Pattern checks (penalties)
-        if re.search(r'(.)\1{2,}', password):
+        if repeat:
             score -= 1
-            feedback.append("⚠ Repeated characters")
+            feedback.append(('warn', "⚠ Repeated characters"))
         
-        if re.search(r'(123|234|345|456|567|678|789|abc|bcd|cde)', password.lower()):
+        if sequential:
             score -= 1
-            feedback.append("⚠ Sequential patterns")
+            feedback.append(('warn', "⚠ Sequential patterns"))
         
         # Determine strength
         score = max(0, score)
@@ -80,13 +391,14 @@ class AdvancedPasswordChecker:
     """Comprehensive password analysis with breach checking"""
     
     @staticmethod
-    def calculate_entropy(password: str) -> float:
-        """Calculate password entropy in bits"""
-        charset = 0
-        if re.search(r'[a-z]', password): charset += 26
-        if re.search(r'[A-Z]', password): charset += 26
-        if re.search(r'[0-9]', password): charset += 10
-        if re.search(r'[^a-zA-Z0-9]', password): charset += 32
+    def calculate_entropy(password: str, charset: Optional[int] = None) -> float:
+        """Calculate password entropy in bits
+        
+        Callers that already know the character classes can pass the
+        charset size to skip classifying the password again.
+        """
+        if charset is None:
+            charset = _charset_size(_char_classes(password))
         
         if charset == 0:
             return 0.0
@@ -97,59 +409,96 @@ class AdvancedPasswordChecker:
     @staticmethod
     def estimate_crack_time(entropy: float) -> str:
         """Estimate time to crack password"""
+        # Anything past ~75 bits is over a million years; this also keeps
+        # 2 ** entropy from overflowing for very long passwords
+        if entropy >= 80:
+            return "Centuries (virtually uncrackable)"
+        
         guesses_per_second = 1_000_000_000
         total_combinations = 2 ** entropy
         seconds = total_combinations / guesses_per_second
         
-        if seconds < 1:
+        bucket = bisect.bisect_right(_CRACK_THRESHOLDS, seconds)
+        if bucket == 0:
             return "Instantly"
-        elif seconds < 60:
-            return f"{int(seconds)} seconds"
-        elif seconds < 3600:
-            return f"{int(seconds / 60)} minutes"
-        elif seconds < 86400:
-            return f"{int(seconds / 3600)} hours"
-        elif seconds < 2592000:
-            return f"{int(seconds / 86400)} days"
-        elif seconds < 31536000:
-            return f"{int(seconds / 2592000)} months"
-        else:
-            years = int(seconds / 31536000)
-            if years > 1_000_000:
+        divisor, unit = _CRACK_UNITS[bucket - 1]
+        amount = int(seconds / divisor)
+        if unit == 'years':
+            if amount > 1_000_000:
                 return "Centuries (virtually uncrackable)"
-            return f"{years:,} years"
+            return f"{amount:,} years"
+        return f"{amount} {unit}"
     
     @staticmethod
     def check_breach(password: str) -> Tuple[bool, int]:
         """Check if password exists in breach database (requires internet)"""
+        if not _HAVE_REQUESTS:
+            print("⚠ 'requests' library not installed. Skipping breach check.")
+            return False, 0
+        
         try:
-            import requests
-            
-            sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+            digest = hashlib.sha1(password.encode('utf-8')).digest()
+            sha1_hash = digest.hex().upper()
             prefix = sha1_hash[:5]
-            suffix = sha1_hash[5:]
-            
-            url = f"https://api.pwnedpasswords.com/range/{prefix}"
-            response = requests.get(url, timeout=3)
-            
-            if response.status_code == 200:
-                hashes = response.text.split('\r\n')
-                for hash_line in hashes:
-                    hash_suffix, count = hash_line.split(':')
-                    if hash_suffix == suffix:
-                        return True, int(count)
+            suffix = sha1_hash[5:].encode('ascii')
             
+            # Lines are "SUFFIX:COUNT" with a 35 character hex suffix, so the
+            # suffix can only match at the start of a line; padding lines
+            # have a count of 0. Searching the raw bytes skips decoding and
+            # splitting the whole response.
+            hashes = _fetch_range(prefix)
+            start = hashes.find(suffix)
+            if start < 0:
+                return False, 0
+            end = hashes.find(b'\r\n', start)
+            count = int(hashes[start + 36:end if end >= 0 else len(hashes)])
+            return count > 0, count
+        except Exception:
+            print("⚠ Breach check failed (internet issue). Continuing...")
             return False, 0
-        except ImportError:
-            print("⚠ 'requests' library not installed. Skipping breach check.")
+    
+    @staticmethod
+    def check_breach_offline(password: str, db_dir: str) -> Tuple[bool, int]:
+        """Check a local copy of the breach database (no internet needed)
+        
+        db_dir holds the HIBP "ordered by hash" SHA-1 list split into 256
+        files named after the first two hex characters (00.txt to FF.txt),
+        each keeping the sorted uppercase "HASH:COUNT" lines. Files are
+        memory-mapped and binary searched, so nothing is loaded into RAM.
+        """
+        try:
+            sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+            path = os.path.join(db_dir, f"{sha1_hash[:2]}.txt")
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False, 0
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    line = _find_hash_line(data, sha1_hash.encode('ascii'))
+        except FileNotFoundError:
+            print(f"⚠ Offline breach file {path} not found. Skipping breach check.")
             return False, 0
         except Exception:
-            print("⚠ Breach check failed (internet issue). Continuing...")
+            print("⚠ Offline breach check failed. Continuing...")
             return False, 0
+        
+        if line is None:
+            return False, 0
+        count = int(line[41:])
+        return count > 0, count
     
     @staticmethod
-    def deep_analysis(password: str) -> dict:
-        """Comprehensive password analysis"""
+    def deep_analysis(password: str, breach_db: Optional[str] = None) -> dict:
+        """Comprehensive password analysis
+        
+        Pass breach_db (see check_breach_offline) to check breaches against
+        a local database instead of the online API.
+        """
+        # Start the breach lookup first so it overlaps the local scoring
+        if breach_db:
+            breach_future = _EXECUTOR.submit(AdvancedPasswordChecker.check_breach_offline, password, breach_db)
+        else:
+            breach_future = _EXECUTOR.submit(AdvancedPasswordChecker.check_breach, password)
+        
         score = 0
         feedback = []
         
@@ -157,87 +506,90 @@ class AdvancedPasswordChecker:
         length = len(password)
         if length >= 16:
             score += 30
-            feedback.append("✓ Excellent length (16+ characters)")
+            feedback.append(('ok', "✓ Excellent length (16+ characters)"))
         elif length >= 12:
             score += 20
-            feedback.append("✓ Good length (12+ characters)")
+            feedback.append(('ok', "✓ Good length (12+ characters)"))
         elif length >= 8:
             score += 10
-            feedback.append("✓ Acceptable length (8+ characters)")
+            feedback.append(('ok', "✓ Acceptable length (8+ characters)"))
         else:
             score += 5
-            feedback.append("✗ Too short (minimum 8 characters)")
+            feedback.append(('bad', "✗ Too short (minimum 8 characters)"))
         
         # Character diversity
+        mask, repeat, runs, seen = _scan(password)
         char_types = 0
-        if re.search(r'[a-z]', password): char_types += 1
-        if re.search(r'[A-Z]', password): char_types += 1
-        if re.search(r'[0-9]', password): char_types += 1
-        if re.search(r'[^a-zA-Z0-9]', password): char_types += 1
+        if mask & _LOWER: char_types += 1
+        if mask & _UPPER: char_types += 1
+        if mask & _DIGIT: char_types += 1
+        if mask & _SPECIAL: char_types += 1
         
         if char_types == 4:
             score += 25
-            feedback.append("✓ Excellent character diversity")
+            feedback.append(('ok', "✓ Excellent character diversity"))
         elif char_types == 3:
             score += 15
-            feedback.append("✓ Good character diversity")
+            feedback.append(('ok', "✓ Good character diversity"))
         elif char_types == 2:
             score += 8
-            feedback.append("⚠ Limited character diversity")
+            feedback.append(('warn', "⚠ Limited character diversity"))
         else:
             score += 3
-            feedback.append("✗ Poor character diversity")
+            feedback.append(('bad', "✗ Poor character diversity"))
         
         # Calculate entropy
-        entropy = AdvancedPasswordChecker.calculate_entropy(password)
+        entropy = AdvancedPasswordChecker.calculate_entropy(password, charset=_charset_size(mask))
         
         if entropy >= 80:
             score += 25
-            feedback.append(f"✓ Very high entropy ({entropy} bits)")
+            feedback.append(('ok', f"✓ Very high entropy ({entropy} bits)"))
         elif entropy >= 60:
             score += 20
-            feedback.append(f"✓ High entropy ({entropy} bits)")
+            feedback.append(('ok', f"✓ High entropy ({entropy} bits)"))
         elif entropy >= 40:
             score += 10
-            feedback.append(f"⚠ Moderate entropy ({entropy} bits)")
+            feedback.append(('warn', f"⚠ Moderate entropy ({entropy} bits)"))
         else:
             score += 5
-            feedback.append(f"✗ Low entropy ({entropy} bits)")
+            feedback.append(('bad', f"✗ Low entropy ({entropy} bits)"))
         
         # Pattern checks
         issues = 0
-        if re.search(r'(.)\1{2,}', password):
+        if repeat:
             issues += 1
-            feedback.append("⚠ Contains repeated characters")
+            feedback.append(('warn', "⚠ Contains repeated characters"))
         
-        if re.search(r'(012|123|234|345|456|567|678|789|abc|bcd|cde|qwer|asdf)', password.lower()):
+        if runs & _RUNS_DEEP or _RE_KEYBOARD.search(password):
             issues += 1
-            feedback.append("⚠ Contains sequential patterns")
+            feedback.append(('warn', "⚠ Contains sequential patterns"))
         
-        if re.search(r'password|admin|welcome|login|123456', password.lower()):
+        if _RE_COMMON.search(password):
             issues += 1
-            feedback.append("⚠ Contains common words")
+            feedback.append(('warn', "⚠ Contains common words"))
         
         score -= issues * 5
         
-        # Uniqueness check
-        unique_ratio = len(set(password)) / length if length > 0 else 0
+        # Uniqueness check (distinct bytes only match distinct characters
+        # for ASCII passwords)
+        unique = len(set(password)) if mask & _HIGH else bin(seen).count('1')
+        unique_ratio = unique / length if length > 0 else 0
         if unique_ratio >= 0.8:
             score += 10
-            feedback.append("✓ High character uniqueness")
+            feedback.append(('ok', "✓ High character uniqueness"))
         elif unique_ratio < 0.5:
             score -= 5
-            feedback.append("⚠ Many repeated characters")
+            feedback.append(('warn', "⚠ Many repeated characters"))
         
         # Cap score
         score = max(0, min(100, score))
         
         # Check breaches
-        is_breached, breach_count = AdvancedPasswordChecker.check_breach(password)
+        is_breached, breach_count = breach_future.result()
         
         if is_breached:
             score = min(score, 15)  # Cap at 15 if breached
-            feedback.insert(0, f"🚨 CRITICAL: Found in {breach_count:,} data breaches!")
+            feedback.insert(0, ('crit', f"🚨 CRITICAL: Found in {breach_count:,} data breaches!"))
         
         # Determine strength
         if score >= 85:
@@ -274,131 +626,120 @@ class AdvancedPasswordChecker:
 
 def display_results(result: dict, password_length: int):
     """Display results in a user-friendly format"""
-    colors = {
-        'red': '\033[91m',
-        'orange': '\033[93m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'green': '\033[92m',
-        'green': '\033[96m',
-        'bold': '\033[1m',
-        'reset': '\033[0m'
-    }
-    
-    c = colors
-    color = colors.get(result['color'], colors['reset'])
+    color = _COLOR_MAP.get(result['color'], _C_RESET)
     
     # Header
     mode_name = "Quick Check" if result['mode'] == 'quick' else "Deep Analysis"
-    print(f"\n{c['green']}{'=' * 60}{c['reset']}")
-    print(f"{c['bold']}{c['green']}       PASSWORD STRENGTH: {mode_name.upper()}{c['reset']}")
-    print(f"{c['green']}{'=' * 60}{c['reset']}\n")
+    print(f"\n{_C_GREEN}{'=' * 60}{_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}       PASSWORD STRENGTH: {mode_name.upper()}{_C_RESET}")
+    print(f"{_C_GREEN}{'=' * 60}{_C_RESET}\n")
     
     # Main results
-    print(f"{c['bold']}Strength:{c['reset']} {color}{result['strength']}{c['reset']}")
-    print(f"{c['bold']}Score:{c['reset']} {color}{result['score']}/{result['max_score']}{c['reset']}")
+    print(f"{_C_BOLD}Strength:{_C_RESET} {color}{result['strength']}{_C_RESET}")
+    print(f"{_C_BOLD}Score:{_C_RESET} {color}{result['score']}/{result['max_score']}{_C_RESET}")
     
     # Progress bar
     bar_width = 40
     filled = int((result['score'] / result['max_score']) * bar_width)
     bar = '█' * filled + '░' * (bar_width - filled)
-    print(f"{c['bold']}Visual:{c['reset']} {color}{bar}{c['reset']}")
+    print(f"{_C_BOLD}Visual:{_C_RESET} {color}{bar}{_C_RESET}")
     
     # Extra metrics for deep analysis
     if result['mode'] == 'deep':
-        print(f"\n{c['bold']}{c['green']}Technical Details:{c['reset']}")
+        print(f"\n{_C_BOLD}{_C_GREEN}Technical Details:{_C_RESET}")
         print(f"  • Password Length: {password_length} characters")
         print(f"  • Entropy: {result['entropy']} bits")
-        print(f"  • Estimated Crack Time: {c['yellow']}{result['crack_time']}{c['reset']}")
+        print(f"  • Estimated Crack Time: {_C_YELLOW}{result['crack_time']}{_C_RESET}")
         
         if result['is_breached']:
-            print(f"\n{c['bold']}{c['red']}⚠️  SECURITY ALERT:{c['reset']}")
-            print(f"  Found in {c['red']}{result['breach_count']:,}{c['reset']} known breaches!")
-            print(f"  {c['red']}Change this password immediately!{c['reset']}")
+            print(f"\n{_C_BOLD}{_C_RED}⚠️  SECURITY ALERT:{_C_RESET}")
+            print(f"  Found in {_C_RED}{result['breach_count']:,}{_C_RESET} known breaches!")
+            print(f"  {_C_RED}Change this password immediately!{_C_RESET}")
         else:
-            print(f"\n{c['green']}✓ Not found in known data breaches{c['reset']}")
+            print(f"\n{_C_GREEN}✓ Not found in known data breaches{_C_RESET}")
     
     # Feedback
-    print(f"\n{c['bold']}{c['green']}Analysis:{c['reset']}")
+    print(f"\n{_C_BOLD}{_C_GREEN}Analysis:{_C_RESET}")
     print("-" * 60)
-    for item in result['feedback']:
-        if '✓' in item:
-            print(f"  {c['green']}{item}{c['reset']}")
-        elif '✗' in item:
-            print(f"  {colors['red']}{item}{c['reset']}")
-        elif '⚠' in item or '🚨' in item:
-            print(f"  {colors['yellow']}{item}{c['reset']}")
-        else:
-            print(f"  {item}")
+    for severity, message in result['feedback']:
+        print(f"  {_SEVERITY_COLORS[severity]}{message}{_C_RESET}")
     
     # Recommendations for weak passwords
     if result['score'] < 60:
-        print(f"\n{c['bold']}{c['green']}💡 Tips to Improve:{c['reset']}")
+        print(f"\n{_C_BOLD}{_C_GREEN}💡 Tips to Improve:{_C_RESET}")
         print("  • Use at least 12 characters (longer is better)")
         print("  • Mix uppercase, lowercase, numbers, and symbols")
         print("  • Avoid personal info and common words")
         print("  • Consider using a passphrase (e.g., 'Blue$Sky-Coffee42')")
     
-    print(f"\n{c['green']}{'=' * 60}{c['reset']}\n")
+    print(f"\n{_C_GREEN}{'=' * 60}{_C_RESET}\n")
+
+
+def batch_main():
+    """Quick check every line of stdin, one tab-separated result per line"""
+    lines = [line.decode('utf-8', 'replace') for line in sys.stdin.buffer.read().splitlines()]
+    passwords = [line for line in lines if line]
+    results = SimplePasswordChecker.batch_check(passwords)
+    sys.stdout.write(''.join(
+        f"{result['strength']}\t{result['score']}\t{password}\n"
+        for password, result in zip(passwords, results)
+    ))
 
 
 def main():
     """Main application"""
-    c = {
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'bold': '\033[1m',
-        'reset': '\033[0m'
-    }
+    if '--batch' in sys.argv[1:]:
+        batch_main()
+        return
     
-    print(f"\n{c['bold']}{c['green']}╔═════════════════════════════════════════════════════════════════════════╗{c['reset']}")
-    print(f"{c['bold']}{c['green']}    ██████╗  █████╗ ███████╗███████╗███████╗ ██████╗     ██████╗    ██╗             {c['reset']}")
-    print(f"{c['bold']}{c['green']}    ██╔══██╗██╔══██╗██╔════╝██╔════╝██╔════╝██╔════╝    ██╔═████╗  ███║           {c['reset']}")
-    print(f"{c['bold']}{c['green']}    ██████╔╝███████║███████╗███████╗█████╗  ██║         ██║██╔██║  ╚██║              {c['reset']}")
-    print(f"{c['bold']}{c['green']}    ██╔═══╝ ██╔══██║╚════██║╚════██║██╔══╝  ██║         ████╔╝██║   ██║               {c['reset']}")
-    print(f"{c['bold']}{c['green']}    ██║     ██║  ██║███████║███████║███████╗╚██████╗    ╚██████╔╝██╗██║              {c['reset']}")
-    print(f"{c['bold']}{c['green']}    ╚═╝     ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝ ╚═════╝     ╚═════╝ ╚═╝╚═╝               {c['reset']}")
-    print(f"{c['bold']}{c['green']}╚═════════════════════════════════════════════════════════════════════════╝{c['reset']}\n")
+    print(f"\n{_C_BOLD}{_C_GREEN}╔═════════════════════════════════════════════════════════════════════════╗{_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ██████╗  █████╗ ███████╗███████╗███████╗ ██████╗     ██████╗    ██╗             {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ██╔══██╗██╔══██╗██╔════╝██╔════╝██╔════╝██╔════╝    ██╔═████╗  ███║           {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ██████╔╝███████║███████╗███████╗█████╗  ██║         ██║██╔██║  ╚██║              {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ██╔═══╝ ██╔══██║╚════██║╚════██║██╔══╝  ██║         ████╔╝██║   ██║               {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ██║     ██║  ██║███████║███████║███████╗╚██████╗    ╚██████╔╝██╗██║              {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}    ╚═╝     ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝ ╚═════╝     ╚═════╝ ╚═╝╚═╝               {_C_RESET}")
+    print(f"{_C_BOLD}{_C_GREEN}╚═════════════════════════════════════════════════════════════════════════╝{_C_RESET}\n")
     
     while True:
         # Mode selection
-        print(f"{c['bold']}Choose analysis mode:{c['reset']}")
+        print(f"{_C_BOLD}Choose analysis mode:{_C_RESET}")
         print("  1. Quick Check (instant, works offline)")
         print("  2. Deep Analysis (comprehensive, requires internet)")
         print("  q. Quit")
         
-        mode = input(f"\n{c['bold']}Select mode (1/2/q):{c['reset']} ").strip().lower()
+        mode = input(f"\n{_C_BOLD}Select mode (1/2/q):{_C_RESET} ").strip().lower()
         
         if mode in ['q', 'quit', 'exit']:
-            print(f"\n{c['green']}Stay secure! 🛡️{c['reset']}\n")
+            print(f"\n{_C_GREEN}Stay secure! 🛡️{_C_RESET}\n")
             break
         
         if mode not in ['1', '2']:
-            print(f"{c['yellow']}⚠ Please enter 1, 2, or q{c['reset']}\n")
+            print(f"{_C_YELLOW}⚠ Please enter 1, 2, or q{_C_RESET}\n")
             continue
         
         # Get password
-        password = input(f"\n{c['bold']}Enter password to check:{c['reset']} ")
+        password = input(f"\n{_C_BOLD}Enter password to check:{_C_RESET} ")
         
         if not password:
-            print(f"{c['yellow']}⚠ Please enter a password!{c['reset']}\n")
+            print(f"{_C_YELLOW}⚠ Please enter a password!{_C_RESET}\n")
             continue
         
         # Analyze based on mode
         if mode == '1':
-            print(f"\n{c['yellow']}Analyzing (quick mode)...{c['reset']}")
+            print(f"\n{_C_YELLOW}Analyzing (quick mode)...{_C_RESET}")
             result = SimplePasswordChecker.quick_check(password)
         else:
-            print(f"\n{c['yellow']}Analyzing (deep mode - checking breaches)...{c['reset']}")
+            print(f"\n{_C_YELLOW}Analyzing (deep mode - checking breaches)...{_C_RESET}")
             result = AdvancedPasswordChecker.deep_analysis(password)
         
         # Display results
         display_results(result, len(password))
         
         # Continue?
-        again = input(f"{c['bold']}Check another password? (y/n):{c['reset']} ").lower()
+        again = input(f"{_C_BOLD}Check another password? (y/n):{_C_RESET} ").lower()
         if again not in ['y', 'yes']:
-            print(f"\n{c['green']}Stay secure! 🛡️{c['reset']}\n")
+            print(f"\n{_C_GREEN}Stay secure! 🛡️{_C_RESET}\n")
             break
 
 